@@ -4,6 +4,19 @@ import shutil
 import sys
 from .parser import deserialize, serialize, merge
 
+# Serialized files are written with a single `write` call; a 1 MiB buffer keeps
+# large payloads from being split into many small `write()` syscalls.
+WRITE_BUFFER_SIZE = 1 << 20
+
+def _read_text(path: str) -> str:
+    """Reads a UTF-8 text file with a single binary read and one decode.
+
+    The parser needs the whole file as a `str`, so the content is decoded in
+    full either way; memory-mapping large files would save nothing.
+    """
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
 def process_directories(input_dir, output_dir, no_overwrite=False, quiet=False, dry_run=False):
     """Walks through an input directory and processes `.txt` files.
 
@@ -57,10 +70,8 @@ def process_directories(input_dir, output_dir, no_overwrite=False, quiet=False,
                     log(f"Merging '{input_path}' into '{output_path}'...")
                     if not dry_run:
                         try:
-                            with open(input_path, 'r', encoding='utf-8') as f:
-                                input_content = f.read()
-                            with open(output_path, 'r', encoding='utf-8') as f:
-                                output_content = f.read()
+                            input_content = _read_text(input_path)
+                            output_content = _read_text(output_path)
 
                             input_data = deserialize(input_content)
                             output_data = deserialize(output_content)
@@ -68,7 +79,7 @@ def process_directories(input_dir, output_dir, no_overwrite=False, quiet=False,
                             merged_data = merge(input_data, output_data)
                             serialized_data = serialize(merged_data)
 
-                            with open(output_path, 'w', encoding='utf-8') as f:
+                            with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
                                 f.write(serialized_data)
                         except Exception as e:
                             print(f"Error merging file {file}: {e}", file=sys.stderr)
@@ -14,8 +14,23 @@ content (text and other tags) are values. Text content is stored under a
 special `"#text"` key.
 """
 import re
+import sys
 from typing import Any, Dict, List, Optional, Tuple
 
+# Matches a whole (stripped) tag line. The alternatives are ordered so that
+# closing tags are tried first and their group numbers encode the tag kind:
+#   1: </tag>    2: [/Action]    3: <tag>    4: [Action]
+# Tag names may not contain spaces or the brackets of their own tag type.
+_TAG_RE = re.compile(r"</([^<> ]*)>|\[/([^\[\] ]*)\]|<([^<> ]*)>|\[([^\[\] ]*)\]")
+# Bound once at import so the per-line hot path skips the attribute lookup.
+_match_tag_line = _TAG_RE.fullmatch
+
+# The special keys are not identifier-like, so CPython does not intern them
+# automatically. Interning them once lets every dict built by the parser share
+# the same key objects, keeping lookups on the identity fast path.
+_TEXT = sys.intern("#text")
+_COMMENTS = sys.intern("#comments")
+
 
 class _Parser:
     """
@@ -35,6 +50,7 @@ class _Parser:
         self.tag_stack: List[Tuple[str, str]] = []
         self.text_buffer: List[str] = []
         self.comment_buffer: List[str] = []
+        self.text_nodes: List[Dict[str, Any]] = []
         self.line_num: int = 0
 
     def _flush_text_buffer(self):
@@ -43,28 +59,31 @@ class _Parser:
             return
 
         # Dedent the collected text block to preserve relative indentation.
-        lines_with_content = [line for line in self.text_buffer if line.strip()]
-        if not lines_with_content:
-            content = "\n".join(self.text_buffer)
+        # Each line is left-stripped once; an empty result marks a blank line.
+        text_buffer = self.text_buffer
+        lstripped = [line.lstrip() for line in text_buffer]
+        indents = [len(line) - len(rest) for line, rest in zip(text_buffer, lstripped) if rest]
+        if not indents:
+            content = "\n".join(text_buffer)
         else:
-            min_indent = min(len(line) - len(line.lstrip()) for line in lines_with_content)
-            dedented_lines = [line[min_indent:] if line.strip() else line for line in self.text_buffer]
-            content = "\n".join(dedented_lines)
+            min_indent = min(indents)
+            content = "\n".join([line[min_indent:] if rest else line for line, rest in zip(text_buffer, lstripped)])
 
         if content:
+            # Text blocks are collected as lists while parsing and joined once
+            # in `_finalize_text`, avoiding a full re-copy on every flush.
             current_dict = self.dict_stack[-1]
-            if "#text" in current_dict:
-                current_dict["#text"] += "\n" + content
-            else:
-                current_dict["#text"] = content
+            text_blocks = current_dict.get(_TEXT)
+            if text_blocks is None:
+                text_blocks = current_dict[_TEXT] = []
+                self.text_nodes.append(current_dict)
+            text_blocks.append(content)
         self.text_buffer.clear()
 
-    def _is_valid_tag_name(self, name: str, is_action: bool = False) -> bool:
-        """Checks if a tag name contains invalid characters (e.g., brackets, spaces)."""
-        if is_action:
-            return not ('[' in name or ']' in name or ' ' in name)
-        else:
-            return not ('<' in name or '>' in name or ' ' in name)
+    def _finalize_text(self):
+        """Joins the collected text blocks of every node into its final `#text` string."""
+        for node in self.text_nodes:
+            node[_TEXT] = "\n".join(node[_TEXT])
 
     def _handle_opening_tag(self, tag_name: str, tag_char: str, comment_part: Optional[str]):
         """Handles the logic for an opening tag."""
@@ -75,10 +94,15 @@ class _Parser:
         if comment_part:
             all_comments.append(comment_part)
 
+        # The buffer list itself becomes the tag's comment list, so a fresh
+        # buffer is only needed when comments were actually handed over.
         if all_comments:
-            new_dict["#comments"] = all_comments
-        self.comment_buffer = []
+            new_dict[_COMMENTS] = all_comments
+            self.comment_buffer = []
 
+        # Tag names recur heavily across a file; interning them lets dict
+        # lookups on the parsed structure hit the identity fast path.
+        tag_name = sys.intern(tag_name)
         self.dict_stack[-1][tag_name] = new_dict
         self.dict_stack.append(new_dict)
         self.tag_stack.append((tag_char, tag_name))
@@ -89,9 +113,9 @@ class _Parser:
         current_dict = self.dict_stack[-1]
 
         if self.comment_buffer:
-            if "#comments" not in current_dict:
-                current_dict["#comments"] = []
-            current_dict["#comments"].extend(self.comment_buffer)
+            if _COMMENTS not in current_dict:
+                current_dict[_COMMENTS] = []
+            current_dict[_COMMENTS].extend(self.comment_buffer)
             self.comment_buffer.clear()
 
         expected_tag = (tag_char, tag_name)
@@ -106,10 +130,8 @@ class _Parser:
 
     def _process_line(self, line: str):
         """Parses a single line and updates the parser's state."""
-        self.line_num += 1
-        parts = line.split('#', 1)
-        code_part = parts[0]
-        comment_part = parts[1].strip() if len(parts) > 1 else None
+        code_part, has_comment, comment_text = line.partition('#')
+        comment_part = comment_text.strip() if has_comment else None
         stripped_line = code_part.strip()
 
         if not stripped_line:
@@ -117,59 +139,51 @@ class _Parser:
                 self.comment_buffer.append(comment_part)
             elif self.comment_buffer:
                 current_dict = self.dict_stack[-1]
-                if "#comments" not in current_dict:
-                    current_dict["#comments"] = []
-                current_dict["#comments"].extend(self.comment_buffer)
+                if _COMMENTS not in current_dict:
+                    current_dict[_COMMENTS] = []
+                current_dict[_COMMENTS].extend(self.comment_buffer)
                 self.comment_buffer.clear()
             if self.text_buffer:
                 self.text_buffer.append("")
             return
 
         # --- TAG MATCHING LOGIC ---
-        # 1. Closing standard tag: </tag>
-        if stripped_line.startswith('</') and stripped_line.endswith('>'):
-            tag_name = stripped_line[2:-1]
-            if self._is_valid_tag_name(tag_name):
-                self._handle_closing_tag(tag_name, '<', comment_part, stripped_line)
-                return
-        # 2. Closing action tag: [/Action]
-        elif stripped_line.startswith('[/') and stripped_line.endswith(']'):
-            tag_name = stripped_line[2:-1]
-            if self._is_valid_tag_name(tag_name, is_action=True):
-                self._handle_closing_tag(tag_name, '[', comment_part, stripped_line)
-                return
-        # 3. Opening standard tag: <tag>
-        elif stripped_line.startswith('<') and stripped_line.endswith('>'):
-            tag_name = stripped_line[1:-1]
-            if self._is_valid_tag_name(tag_name):
-                self._handle_opening_tag(tag_name, '<', comment_part)
-                return
-        # 4. Opening action tag: [Action]
-        elif stripped_line.startswith('[') and stripped_line.endswith(']'):
-            tag_name = stripped_line[1:-1]
-            if self._is_valid_tag_name(tag_name, is_action=True):
-                self._handle_opening_tag(tag_name, '[', comment_part)
-                return
+        # A single compiled pattern classifies the line; `lastindex` tells
+        # which alternative matched (see `_TAG_RE`).
+        match = _match_tag_line(stripped_line)
+        if match:
+            kind = match.lastindex
+            tag_char = '<' if kind in (1, 3) else '['
+            if kind <= 2:
+                self._handle_closing_tag(match.group(kind), tag_char, comment_part, stripped_line)
+            else:
+                self._handle_opening_tag(match.group(kind), tag_char, comment_part)
+            return
 
         # If no tag matched, it's text content.
         self.text_buffer.append(line)
 
     def deserialize(self, text: str) -> Dict[str, Any]:
         """Main entry point for the parser instance. Processes the entire text."""
-        lines = text.splitlines()
-        for line in lines:
-            self._process_line(line)
+        # Bind the per-line handler once; this loop runs for every input line.
+        # The text is split a single time and the line number used in error
+        # messages comes straight from the enumeration.
+        process_line = self._process_line
+        for line_num, line in enumerate(text.splitlines(), 1):
+            self.line_num = line_num
+            process_line(line)
 
         self._flush_text_buffer()
 
         if self.comment_buffer:
-            if "#comments" not in self.root:
-                self.root["#comments"] = []
-            self.root["#comments"].extend(self.comment_buffer)
+            if _COMMENTS not in self.root:
+                self.root[_COMMENTS] = []
+            self.root[_COMMENTS].extend(self.comment_buffer)
 
         if self.tag_stack:
             raise ValueError(f"Unclosed tags at end of file: {self.tag_stack}")
 
+        self._finalize_text()
         return self.root
 
 
@@ -206,35 +220,9 @@ def merge(d1: Dict[str, Any], d2: Dict[str, Any]) -> Dict[str, Any]:
 
     This is useful for combining a base configuration with a set of overrides.
 
-    Args:
-        d1: The primary dictionary, whose values take precedence in conflicts.
-        d2: The secondary dictionary, whose values are used if the key is not
-            present in `d1`.
-
-    Returns:
-        A new dictionary containing the merged key-value pairs.
-    """
-    merged = d1.copy()
-    for key, value in d2.items():
-        if key in merged:
-            if isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = merge(merged[key], value)
-        else:
-            merged[key] = value
-    return merged
-
-
-def merge(d1: Dict[str, Any], d2: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively merges two dictionaries, giving precedence to the first.
-
-    This function combines two dictionaries into a new, merged dictionary.
-    The merging logic is as follows:
-    - For keys present in both dictionaries, if both corresponding values are
-      themselves dictionaries, the function will merge them recursively.
-    - Otherwise, the value from the first dictionary (`d1`) is used.
-    - Keys unique to either dictionary are included in the result.
-
-    This is useful for combining a base configuration with a set of overrides.
+    The nested merge is driven by an explicit work stack rather than recursive
+    calls. Every dictionary from `d1` that takes part in a nested merge is
+    copied before it is modified, so neither input is mutated.
 
     Args:
         d1: The primary dictionary, whose values take precedence in conflicts.
@@ -245,12 +233,17 @@ def merge(d1: Dict[str, Any], d2: Dict[str, Any]) -> Dict[str, Any]:
         A new dictionary containing the merged key-value pairs.
     """
     merged = d1.copy()
-    for key, value in d2.items():
-        if key in merged:
-            if isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = merge(merged[key], value)
-        else:
-            merged[key] = value
+    stack = [(merged, d2)]
+    while stack:
+        destination, source = stack.pop()
+        for key, value in source.items():
+            if key in destination:
+                current = destination[key]
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current = destination[key] = current.copy()
+                    stack.append((current, value))
+            else:
+                destination[key] = value
     return merged
 
 
@@ -271,8 +264,8 @@ def serialize(data: Dict[str, Any]) -> str:
     """
     result = []
 
-    if "#comments" in data:
-        for comment in data["#comments"]:
+    if _COMMENTS in data:
+        for comment in data[_COMMENTS]:
             result.append(f"# {comment}")
         if any(not k.startswith("#") for k in data.keys()):
             result.append("")
@@ -281,40 +274,38 @@ def serialize(data: Dict[str, Any]) -> str:
         if key.startswith("#") or not isinstance(value, dict):
             continue
 
-        if "#comments" in value:
-            for comment in value["#comments"]:
+        if _COMMENTS in value:
+            for comment in value[_COMMENTS]:
                 result.append(f"# {comment}")
 
         result.append(f"[{key}]")
-        content = _serialize_content(value, 1)
-        if content:
-            result.append(content)
+        _serialize_content(value, 1, result)
         result.append(f"[/{key}]")
 
     return "\n".join(result)
 
 
-def _serialize_content(data: Dict[str, Any], level: int) -> str:
-    """Recursively serializes the content (text and tags) within a given dict."""
-    result: List[str] = []
+def _serialize_content(data: Dict[str, Any], level: int, result: List[str]) -> None:
+    """Recursively serializes the content (text and tags) within a given dict.
+
+    Lines are appended to the shared `result` list rather than joined per
+    level, so the document is materialized exactly once by `serialize`.
+    """
     indent = "\t" * level
 
-    if "#text" in data:
-        for line in data["#text"].split('\n'):
-            result.append(f"{indent}{line}")
+    if _TEXT in data:
+        # Indent the whole text block in one C-level pass instead of
+        # splitting it and formatting each line in Python.
+        result.append(indent + data[_TEXT].replace("\n", "\n" + indent))
 
     for key, value in data.items():
         if key.startswith("#") or not isinstance(value, dict):
             continue
 
-        if "#comments" in value:
-            for comment in value["#comments"]:
+        if _COMMENTS in value:
+            for comment in value[_COMMENTS]:
                 result.append(f"{indent}# {comment}")
 
         result.append(f"{indent}<{key}>")
-        content = _serialize_content(value, level + 1)
-        if content:
-            result.append(content)
-        result.append(f"{indent}</{key}>")
-
-    return "\n".join(result)
\ No newline at end of file
+        _serialize_content(value, level + 1, result)
+        result.append(f"{indent}</{key}>")
\ No newline at end of file
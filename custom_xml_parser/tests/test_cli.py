@@ -132,6 +132,20 @@ class TestCli(unittest.TestCase):
         sys.stderr = old_stderr # Restore stderr
         self.assertIn("Error merging file bad_file.txt", captured_stderr.getvalue())
 
+    def test_merge_decodes_utf8_files(self):
+        """Tests that merge inputs are decoded as UTF-8."""
+        with open(os.path.join(self.input_dir, 'big.txt'), 'w', encoding='utf-8') as f:
+            f.write('[Merge]\n<input>\nごはん\n</input>\n[/Merge]')
+        with open(os.path.join(self.output_dir, 'big.txt'), 'w', encoding='utf-8') as f:
+            f.write('[Merge]\n<output>\nyes\n</output>\n[/Merge]')
+
+        process_directories(self.input_dir, self.output_dir, quiet=True)
+
+        with open(os.path.join(self.output_dir, 'big.txt'), 'r', encoding='utf-8') as f:
+            content = f.read()
+        self.assertIn('ごはん', content)
+        self.assertIn('<output>', content)
+
     def test_main_function(self):
         """Tests the main function with command-line arguments."""
         with open(os.path.join(self.input_dir, 'test.txt'), 'w') as f:
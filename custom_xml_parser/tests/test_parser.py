@@ -124,9 +124,14 @@ EXAMPLE_DATA = """
 
 class TestParser(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        """Parses `EXAMPLE_DATA` once; tests that use it must not mutate it."""
+        cls._example = deserialize(EXAMPLE_DATA)
+
     def test_round_trip_with_comments(self):
         """Tests that deserializing and then serializing results in the same data structure, including comments."""
-        deserialized_data = deserialize(EXAMPLE_DATA)
+        deserialized_data = self._example
 
         # Check that top-level comments are parsed
         self.assertIn("#comments", deserialized_data["WantFood"])
@@ -222,6 +227,17 @@ class TestParser(unittest.TestCase):
         merged2 = merge(d3, d4)
         self.assertEqual(merged2, expected2)
 
+    def test_merge_does_not_mutate_inputs(self):
+        """Tests that merging nested dictionaries leaves both inputs untouched."""
+        d1 = {"action": {"tag": {"#text": "d1"}}}
+        d2 = {"action": {"tag": {"sub": {"#text": "d2"}}, "other": {}}}
+
+        merged = merge(d1, d2)
+
+        self.assertEqual(merged, {"action": {"tag": {"#text": "d1", "sub": {"#text": "d2"}}, "other": {}}})
+        self.assertEqual(d1, {"action": {"tag": {"#text": "d1"}}})
+        self.assertEqual(d2, {"action": {"tag": {"sub": {"#text": "d2"}}, "other": {}}})
+
 
     def test_unclosed_tags(self):
         """Tests that unclosed tags raise a ValueError."""
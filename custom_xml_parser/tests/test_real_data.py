@@ -1,16 +1,28 @@
 import unittest
-import os
+from functools import lru_cache
+from pathlib import Path
 from custom_xml_parser.parser import deserialize
 
+DATA_DIR = Path(__file__).parent / 'data'
+
+
+@lru_cache(maxsize=None)
+def _load(name):
+    """Reads a fixture file from the `data` directory, caching its contents."""
+    return (DATA_DIR / name).read_bytes().decode('utf-8')
+
+
 class TestRealData(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        """Parses each real-world fixture once for the whole class."""
+        cls._ev = deserialize(_load('yuyuko_ev_j.txt'))
+        cls._j = deserialize(_load('yuyuko_j.txt'))
+
     def test_parse_yuyuko_ev_j_data(self):
         """Tests parsing of a real-world data file."""
-        data_path = os.path.join(os.path.dirname(__file__), 'data', 'yuyuko_ev_j.txt')
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = f.read()
-
-        parsed_data = deserialize(data)
+        parsed_data = self._ev
 
         # Basic checks to ensure the data was parsed
         self.assertIn('ConcernAboutFather', parsed_data)
@@ -25,11 +37,7 @@ class TestRealData(unittest.TestCase):
         
     def test_parse_yuyuko_j_data(self):
         """Tests parsing of a real-world data file."""
-        data_path = os.path.join(os.path.dirname(__file__), 'data', 'yuyuko_j.txt')
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = f.read()
-
-        parsed_data = deserialize(data)
+        parsed_data = self._j
 
         # Basic checks to ensure the data was parsed
         self.assertIn('WantFood', parsed_data)
@@ -1,7 +1,12 @@
 import argparse
+import contextlib
+import dataclasses
+import functools
 import os
+import stat
 import sys
-from typing import Optional, Tuple, Dict, Any
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 if __name__ == "__main__" and not __package__:
     parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -10,23 +15,31 @@ if __name__ == "__main__" and not __package__:
     import text_translator
     __package__ = "text_translator"
 
-from .translator_lib.core import translate_file
 from .translator_lib.options import TranslationOptions
 from .translator_lib import model_loader
-from .translator_lib.api_client import check_server_status, DEFAULT_API_BASE_URL
 from .translator_lib.exceptions import TranslatorError
 from . import color_console as cc
 
 __version__ = "1.1.0"
 
+# Buffer size for writing translated output files.
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+# Outputs longer than this many characters are encoded in slices of
+# WRITE_CHUNK_SIZE characters instead of all at once.
+CHUNKED_WRITE_THRESHOLD = 256 * 1024
+WRITE_CHUNK_SIZE = 64 * 1024
+
 def _validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser):
-    """Performs validation checks on parsed command-line arguments."""
-    if not os.path.exists(args.input_path):
-        parser.error(f"Input path does not exist: {args.input_path}")
+    """Performs cross-argument checks that argparse cannot express natively."""
     if args.refine and not args.draft_model:
         parser.error("--draft-model is required when using --refine.")
-    if args.glossary_file and not os.path.exists(args.glossary_file):
-        parser.error(f"Glossary file not found: {args.glossary_file}")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    # The server holds a single loaded model, and refinement switches between
+    # the draft and refine models for every node; concurrent workers would
+    # race each other's model swaps.
+    if args.refine and args.jobs > 1:
+        parser.error("--jobs greater than 1 cannot be combined with --refine.")
     if args.glossary_for and not (args.glossary_file or args.glossary_text):
         parser.error("--glossary-for requires a glossary to be provided via --glossary-file or --glossary-text.")
 
@@ -45,17 +58,47 @@ def _load_configs(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
     return {}, {}
 
 
-def _build_translation_options(args: argparse.Namespace, main_model_config: Dict[str, Any], draft_model_config: Dict[str, Any]) -> TranslationOptions:
+def _read_glossary(path: str) -> str:
+    """Reads a glossary file with a single binary read and one UTF-8 decode.
+
+    Line endings are normalized to `\n` exactly as text mode would, but the
+    normalization pass only runs when the file actually contains `\r`. The
+    decoded text of the most recent glossary is cached until the file's
+    modification time, size or inode changes, so repeated runs in one process
+    read it only once.
+    """
+    st = os.stat(path)
+    return _read_glossary_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+@functools.lru_cache(maxsize=1)
+def _read_glossary_cached(path: str, mtime_ns: int, size: int, inode: int) -> str:
+    """Reads and decodes `path`; the stat fields only key the cache."""
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _load_glossary(args: argparse.Namespace, parser: argparse.ArgumentParser) -> Optional[str]:
+    """Returns the glossary text from `--glossary-text` or `--glossary-file`.
+
+    The file is opened directly rather than checked for existence first; a
+    missing file is reported through the parser like any other usage error.
+    """
+    if not args.glossary_file:
+        return args.glossary_text
+    try:
+        return _read_glossary(args.glossary_file)
+    except FileNotFoundError:
+        parser.error(f"Glossary file not found: {args.glossary_file}")
+    # This line is unreachable but satisfies type checkers
+    return None
+
+def _build_translation_options(args: argparse.Namespace, glossary_text: Optional[str], main_model_config: Dict[str, Any], draft_model_config: Dict[str, Any]) -> TranslationOptions:
     """Assembles the TranslationOptions object from arguments and configurations."""
-    glossary_text = args.glossary_text
-    if args.glossary_file:
-        with open(args.glossary_file, 'r', encoding='utf-8') as f:
-            glossary_text = f.read()
+    from .translator_lib.api_client import DEFAULT_API_BASE_URL
 
     api_url = args.api_base_url or os.environ.get("OOBABOOGA_API_BASE_URL") or DEFAULT_API_BASE_URL
-    cc.print_info("Checking server status...", quiet=args.quiet)
-    check_server_status(api_url, args.debug)
-    cc.print_success("Server is active.", quiet=args.quiet)
 
     return TranslationOptions(
         input_path=args.input_path,
@@ -77,29 +120,97 @@ def _build_translation_options(args: argparse.Namespace, main_model_config: Dict
         draft_model_config=draft_model_config,
     )
 
+def check_server_status(api_base_url: str, debug: bool = False) -> None:
+    """Runs `translator_lib.api_client.check_server_status`, importing it on first use.
+
+    The API client imports `requests`, the single most expensive import of
+    the CLI, so it is only loaded once a run actually needs the server.
+    """
+    from .translator_lib.api_client import check_server_status as _check_server_status
+    _check_server_status(api_base_url, debug)
+
+def translate_file(options: TranslationOptions) -> str:
+    """Runs `translator_lib.core.translate_file`, importing it on first use.
+
+    The core module pulls in the progress bar, the XML parser and the
+    translation stack. Deferring that import keeps `--help`, `--version` and
+    argument errors from paying for it.
+    """
+    from .translator_lib.core import translate_file as _translate_file
+    return _translate_file(options)
+
+def _ensure_output_dir(output_dir: str) -> bool:
+    """Creates `output_dir` if needed.
+
+    Returns:
+        False if the path is blocked by an existing file, True otherwise.
+    """
+    # `exist_ok` only tolerates an existing directory, so a file in the way
+    # surfaces here without a separate exists/isdir check.
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+    except (FileExistsError, NotADirectoryError):
+        cc.print_error(f"Error: Cannot create directory '{output_dir}' because a file with the same name exists.")
+        return False
+    return True
+
+def _encode_output(text: str) -> bytes:
+    """Encodes `text` to the bytes text mode would write.
+
+    Like a text-mode file, `\n` is translated to `os.linesep`, so outputs keep
+    the platform's line endings (CRLF on Windows).
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode('utf-8')
+
+def _write_atomic(output_file: str, content: str) -> None:
+    """Writes `content` to a temporary file and moves it over `output_file`.
+
+    An interrupted run therefore never leaves a truncated output behind, which
+    would otherwise be skipped as "already translated" on the next run.
+    Content larger than `CHUNKED_WRITE_THRESHOLD` is encoded and written in
+    `WRITE_CHUNK_SIZE` slices, so no full-size bytes copy is built.
+    """
+    tmp_file = f"{output_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            if len(content) <= CHUNKED_WRITE_THRESHOLD:
+                f.write(_encode_output(content))
+            else:
+                for start in range(0, len(content), WRITE_CHUNK_SIZE):
+                    f.write(_encode_output(content[start:start + WRITE_CHUNK_SIZE]))
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+        raise
+
 def process_single_file(input_file: str, output_file: Optional[str], options: 'TranslationOptions') -> None:
     """Handles the translation process for a single file."""
     try:
+        # Skip finished outputs up front so reruns do not redo (or, through
+        # the empty result `translate_file` returns, truncate) completed work.
+        if output_file and not options.overwrite and os.path.exists(output_file):
+            cc.print_info(f"Skipping '{input_file}': output file '{output_file}' already exists.", quiet=options.quiet)
+            return
+
         cc.print_info(f"Starting translation for '{input_file}'...", quiet=options.quiet)
         if options.refine_mode:
             cc.print_info(f"Using refinement mode with draft model '{options.draft_model}' and refiner '{options.model_name}'.", quiet=options.quiet)
 
-        options.input_path = input_file
-        options.output_path = output_file
+        # The job-wide options are shared across files (and worker threads), so
+        # the per-file paths go on a copy instead of being written back.
+        file_options = dataclasses.replace(options, input_path=input_file, output_path=output_file)
 
-        translated_content = translate_file(options)
+        translated_content = translate_file(file_options)
 
         if output_file:
             output_dir = os.path.dirname(output_file)
-            if output_dir:
-                # Defensive check: ensure the target directory path is not a file.
-                if os.path.exists(output_dir) and not os.path.isdir(output_dir):
-                    cc.print_error(f"Error: Cannot create directory '{output_dir}' because a file with the same name exists.")
-                    return
-                os.makedirs(output_dir, exist_ok=True)
-
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(translated_content)
+            if output_dir and not _ensure_output_dir(output_dir):
+                return
+
+            _write_atomic(output_file, translated_content)
             cc.print_success(f"\nTranslation complete. Output saved to {output_file}", quiet=options.quiet)
         else:
             cc.print_translation(translated_content, quiet=options.quiet)
@@ -107,51 +218,154 @@ def process_single_file(input_file: str, output_file: Optional[str], options: 'T
     except Exception as e:
         cc.print_error(f"Error processing file {input_file}: {e}")
 
+def _iter_files(input_dir: str, recursive: bool) -> Iterator[Tuple[str, str]]:
+    """Yields `(input_file, relative_path)` for every file under `input_dir`.
+
+    `DirEntry.is_file`/`is_dir` use the type reported by the directory listing,
+    so only symlinks need an extra stat, and the relative path is built by
+    concatenation rather than `os.path.relpath`. Recursive runs visit
+    directories breadth-first from a queue, streaming entries with a single
+    `os.scandir` handle open at a time. As with `os.walk`, a directory listing
+    that fails while recursing is skipped and symlinked directories are not
+    followed.
+    """
+    if not recursive:
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield entry.path, entry.name
+        return
+
+    pending = deque([(input_dir, "")])
+    while pending:
+        directory, relative_dir = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative_path = relative_dir + entry.name
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            pending.append((entry.path, relative_path + os.sep))
+                    else:
+                        yield entry.path, relative_path
+        except OSError:
+            continue
+
+def _is_dir_blocked(directory: str, blocked_dirs: Dict[str, bool]) -> bool:
+    """Returns whether a file occupies `directory` or one of its missing parents.
+
+    Only stats are made, so nothing is created. Results are memoized in
+    `blocked_dirs`, which also covers the parents looked up along the way.
+    """
+    blocked = blocked_dirs.get(directory)
+    if blocked is not None:
+        return blocked
+    try:
+        blocked = not stat.S_ISDIR(os.stat(directory).st_mode)
+    except NotADirectoryError:
+        blocked = True
+    except FileNotFoundError:
+        parent = os.path.dirname(directory)
+        blocked = bool(parent) and parent != directory and _is_dir_blocked(parent, blocked_dirs)
+    except OSError:
+        # Other failures (e.g. a permission error) are left to the write of
+        # each file, which reports them per file like any other OSError.
+        blocked = False
+    blocked_dirs[directory] = blocked
+    return blocked
+
 def process_directory(args: argparse.Namespace, options: 'TranslationOptions') -> None:
-    """Handles the translation process for an entire directory."""
+    """Handles the translation process for an entire directory.
+
+    The files to translate are collected first. With `--jobs 1` (the default)
+    they are processed one after another; with a higher value they are handed
+    to a thread pool so that several API requests can be in flight at once.
+    """
     input_dir = args.input_path
     output_dir_base = args.output or f"{os.path.basename(input_dir)}_translated"
 
-    if not os.path.exists(output_dir_base):
-        os.makedirs(output_dir_base, exist_ok=True)
+    if not _ensure_output_dir(output_dir_base):
+        return
 
-    if args.recursive:
-        for root, _, files in os.walk(input_dir):
-            for file in files:
-                input_file = os.path.join(root, file)
-                relative_path = os.path.relpath(input_file, input_dir)
-                output_file = os.path.join(output_dir_base, relative_path)
+    # Subdirectories are only created when a file is written into them, so
+    # the collision check below makes no changes on disk.
+    blocked_dirs: Dict[str, bool] = {output_dir_base: False}
 
-                # Bug fix: Check for file/directory name collision before processing.
-                output_dir_of_file = os.path.dirname(output_file)
-                if os.path.exists(output_dir_of_file) and not os.path.isdir(output_dir_of_file):
-                    cc.print_error(f"Skipping '{input_file}': Cannot create output directory because a file named '{os.path.basename(output_dir_of_file)}' exists in the parent output directory.")
-                    continue
+    file_pairs: List[Tuple[str, str]] = []
+    # Bug fix: Check for file/directory name collision before processing, so
+    # no translation is spent on a file whose output cannot be written. The
+    # check runs, and a blocked directory is reported, once per output
+    # directory rather than once per file.
+    #
+    # Bound once; the loop runs for every file in the tree. Output paths are
+    # the base directory plus a separator, followed by the relative path.
+    output_prefix = os.path.join(output_dir_base, "")
+    dirname = os.path.dirname
+    get_blocked, add_pair = blocked_dirs.get, file_pairs.append
+    for input_file, relative_path in _iter_files(input_dir, args.recursive):
+        output_file = output_prefix + relative_path
 
-                process_single_file(input_file, output_file, options)
-    else:
-        for item in os.listdir(input_dir):
-            input_file = os.path.join(input_dir, item)
-            if os.path.isfile(input_file):
-                output_file = os.path.join(output_dir_base, item)
-                process_single_file(input_file, output_file, options)
+        output_dir_of_file = dirname(output_file)
+        blocked = get_blocked(output_dir_of_file)
+        if blocked is None:
+            blocked = _is_dir_blocked(output_dir_of_file, blocked_dirs)
+            if blocked:
+                cc.print_error(f"Skipping files in '{dirname(input_file)}': Cannot create output directory '{output_dir_of_file}' because a file exists in its path.")
+        if blocked:
+            continue
+
+        add_pair((input_file, output_file))
+
+    if args.jobs <= 1:
+        for input_file, output_file in file_pairs:
+            process_single_file(input_file, output_file, options)
+        return
+
+    # Only parallel runs need the thread pool; `concurrent.futures` also pulls
+    # in `logging`, so importing it here keeps it off the startup path.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    # `process_single_file` never mutates `options`, so all jobs share it.
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [
+            executor.submit(process_single_file, input_file, output_file, options)
+            for input_file, output_file in file_pairs
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 def main_logic(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
     """Orchestrates the main application workflow after argument parsing."""
     _validate_args(args, parser)
+    # A single stat both confirms the input exists and tells files from
+    # directories below.
+    try:
+        input_mode = os.stat(args.input_path).st_mode
+    except OSError:
+        parser.error(f"Input path does not exist: {args.input_path}")
+    glossary_text = _load_glossary(args, parser)
     main_model_config, draft_model_config = _load_configs(args, parser)
-    options = _build_translation_options(args, main_model_config, draft_model_config)
+    options = _build_translation_options(args, glossary_text, main_model_config, draft_model_config)
 
-    if os.path.isdir(args.input_path):
+    cc.print_info("Checking server status...", quiet=args.quiet)
+    check_server_status(options.api_base_url, args.debug)
+    cc.print_success("Server is active.", quiet=args.quiet)
+
+    if stat.S_ISDIR(input_mode):
         cc.print_info(f"Input is a directory. Translating all files in '{args.input_path}'...", quiet=args.quiet)
         process_directory(args, options)
-    elif os.path.isfile(args.input_path):
+    elif stat.S_ISREG(input_mode):
         process_single_file(args.input_path, args.output, options)
     else:
         parser.error(f"Input path is not a valid file or directory: {args.input_path}")
 
-def main() -> None:
-    """Defines and executes the command-line interface for the translator."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the command-line parser.
+
+    The parser holds no per-invocation state, so it is constructed once per
+    process and reused by every call to `main()`.
+    """
     parser = argparse.ArgumentParser(
         description="A command-line tool to translate text files from Japanese to English using a local LLM API.",
         formatter_class=argparse.RawTextHelpFormatter,
@@ -173,6 +387,7 @@ def main() -> None:
     dir_group = parser.add_argument_group('Directory Options')
     dir_group.add_argument('--recursive', dest='recursive', action='store_true', help="Process directories recursively (default).")
     dir_group.add_argument('--no-recursive', dest='recursive', action='store_false', help="Disable recursive processing.")
+    dir_group.add_argument('--jobs', '-j', type=int, default=1, help="Number of files to translate concurrently (default: 1). Cannot be combined with --refine, which switches models on the server for every node.")
     parser.set_defaults(recursive=True)
 
     refine_group = parser.add_argument_group('Refinement Mode')
@@ -196,8 +411,21 @@ def main() -> None:
     verbosity_group.add_argument("--verbose", action="store_true", help="Enable verbose output.")
     verbosity_group.add_argument("--quiet", "-q", action="store_true", help="Suppress all informational output.")
     info_group.add_argument("--debug", action="store_true", help="Enable extensive debug output.")
+    return parser
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses `argv` (by default `sys.argv[1:]`) with the shared parser."""
+    return _build_parser().parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Defines and executes the command-line interface for the translator.
 
-    args = parser.parse_args()
+    Args:
+        argv: The arguments to parse, without the program name. Defaults to
+              `sys.argv[1:]`.
+    """
+    parser = _build_parser()
+    args = _parse_args(argv)
 
     try:
         main_logic(args, parser)
@@ -1,27 +1,44 @@
+import os
 import sys
 from typing import Optional
 
-try:
-    import colorama
-    colorama.init()
+# Terminals outside Windows, Windows Terminal and ANSICON all understand ANSI
+# escape codes. There the codes are emitted directly: `colorama.init()` would
+# otherwise wrap `sys.stdout` in a filter that scans every write (and, when
+# output is piped, strips the codes that we never emit there anyway).
+_NATIVE_ANSI = sys.platform != "win32" or "WT_SESSION" in os.environ or "ANSICON" in os.environ
 
-    # Define color constants
-    COLOR_SUCCESS = colorama.Fore.GREEN
-    COLOR_WARNING = colorama.Fore.YELLOW
-    COLOR_ERROR = colorama.Fore.RED
-    COLOR_INFO = colorama.Fore.CYAN
-    COLOR_RESET = colorama.Style.RESET_ALL
+if _NATIVE_ANSI:
+    COLOR_SUCCESS = "\x1b[32m"
+    COLOR_WARNING = "\x1b[33m"
+    COLOR_ERROR = "\x1b[31m"
+    COLOR_INFO = "\x1b[36m"
+    COLOR_RESET = "\x1b[0m"
 
     IS_TTY = sys.stdout.isatty()
 
-except ImportError:
-    # If colorama is not installed, create dummy constants
-    COLOR_SUCCESS = ''
-    COLOR_WARNING = ''
-    COLOR_ERROR = ''
-    COLOR_INFO = ''
-    COLOR_RESET = ''
-    IS_TTY = False
+else:
+    try:
+        import colorama
+        colorama.init()
+
+        # Define color constants
+        COLOR_SUCCESS = colorama.Fore.GREEN
+        COLOR_WARNING = colorama.Fore.YELLOW
+        COLOR_ERROR = colorama.Fore.RED
+        COLOR_INFO = colorama.Fore.CYAN
+        COLOR_RESET = colorama.Style.RESET_ALL
+
+        IS_TTY = sys.stdout.isatty()
+
+    except ImportError:
+        # If colorama is not installed, create dummy constants
+        COLOR_SUCCESS = ''
+        COLOR_WARNING = ''
+        COLOR_ERROR = ''
+        COLOR_INFO = ''
+        COLOR_RESET = ''
+        IS_TTY = False
 
 
 def _is_quiet(quiet_arg: Optional[bool]) -> bool:
@@ -29,8 +46,12 @@ def _is_quiet(quiet_arg: Optional[bool]) -> bool:
     return quiet_arg is True
 
 
-def _print_colored(message: str, color: str, file=sys.stdout, quiet: Optional[bool] = False):
-    """Internal function to print a message with a specified color."""
+def _print_colored(message: str, color: str, file=None, quiet: Optional[bool] = False):
+    """Internal function to print a message with a specified color.
+
+    `file=None` lets `print` pick up the current `sys.stdout`, which also
+    follows any later redirection of the stream.
+    """
     if _is_quiet(quiet):
         return
 
@@ -73,4 +94,4 @@ def print_translation(content: str, quiet: Optional[bool] = False):
     else:
         print("\n--- Translated Content ---")
         print(content)
-        print("--------------------------")
\ No newline at end of file
+        print("--------------------------")
@@ -1,31 +1,62 @@
+import argparse
 import unittest
 from unittest.mock import patch, call, ANY
 import os
 from io import StringIO
+from contextlib import redirect_stderr, redirect_stdout
 import tempfile
 import shutil
-import sys
+import dataclasses
+from pathlib import Path
 
 from text_translator import cli
 from text_translator.translator_lib.options import TranslationOptions
 
+# Raised by the mocked `translate_file` to exercise per-file error handling.
+_CORE_ERROR = RuntimeError("Core error")
+
 class TestCommandLineInterface(unittest.TestCase):
 
-    def setUp(self):
-        """Set up a temporary directory for tests."""
-        self.test_dir = tempfile.mkdtemp()
-        self.input_file = os.path.join(self.test_dir, "input.txt")
-        with open(self.input_file, "w") as f:
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by all tests in the class."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls._root = cls._tmp.name
+        # The content is never read (translation is mocked out), so a single
+        # input file serves every test.
+        cls.input_file = os.path.join(cls._root, "input.txt")
+        with open(cls.input_file, "w") as f:
             f.write("test")
+        # Command line shared by the tests that run the CLI on the input file.
+        cls._BASE_ARGS = (cls.input_file, "--model", "test-model")
+        # `cli.main()` reuses the cached parser, so it is built once here
+        # rather than inside whichever test happens to run first.
+        cls._parser = cli._build_parser()
 
-    def tearDown(self):
-        """Clean up the temporary directory."""
-        shutil.rmtree(self.test_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory and everything in it."""
+        cls._tmp.cleanup()
 
-    @patch('text_translator.cli.model_loader')
-    @patch('text_translator.cli.check_server_status')
-    @patch('text_translator.cli.process_single_file')
-    def test_cli_single_file(self, mock_process_single_file, mock_check_server_status, mock_model_loader):
+    def setUp(self):
+        """Give each test its own subdirectory of the shared directory."""
+        self.test_dir = os.path.join(self._root, self._testMethodName)
+        os.mkdir(self.test_dir)
+        # Nearly every test needs the server check stubbed out, so it is
+        # swapped by plain assignment here instead of a patcher per test.
+        self._check_server_status = cli.check_server_status
+        cli.check_server_status = unittest.mock.Mock()
+        self.addCleanup(setattr, cli, 'check_server_status', self._check_server_status)
+        # Every CLI run loads model configs; tests that care about the
+        # returned config override these defaults.
+        patcher = patch('text_translator.cli.model_loader')
+        self.mock_model_loader = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_model_loader.load_model_configs.return_value = {"test-model": {}}
+        self.mock_model_loader.get_model_config.return_value = {}
+
+    @patch('text_translator.cli.process_single_file', autospec=True)
+    def test_cli_single_file(self, mock_process_single_file):
         """Tests that the CLI correctly processes a single file input.
 
         This test simulates running the CLI with basic arguments for a single
@@ -35,18 +66,14 @@ class TestCommandLineInterface(unittest.TestCase):
 
         Args:
             mock_process_single_file: Mock for the `process_single_file` function.
-            mock_check_server_status: Mock for the `check_server_status` function.
-            mock_model_loader: Mock for the `model_loader` module.
         """
-        # Setup mock for model_loader
-        mock_model_loader.load_model_configs.return_value = {"test-model": {"params": {}}}
-        mock_model_loader.get_model_config.return_value = {"params": {"temp": 0.5}}
+        self.mock_model_loader.load_model_configs.return_value = {"test-model": {"params": {}}}
+        self.mock_model_loader.get_model_config.return_value = {"params": {"temp": 0.5}}
 
-        test_args = ["cli.py", self.input_file, "--model", "test-model"]
-        with patch.object(sys, 'argv', test_args):
-            cli.main()
+        test_args = list(self._BASE_ARGS)
+        cli.main(test_args)
 
-        mock_check_server_status.assert_called_once()
+        cli.check_server_status.assert_called_once()
         mock_process_single_file.assert_called_once_with(self.input_file, None, ANY)
 
         # Check that the third argument is a TranslationOptions object
@@ -55,10 +82,8 @@ class TestCommandLineInterface(unittest.TestCase):
         self.assertEqual(passed_options.model_name, "test-model")
         self.assertEqual(passed_options.model_config, {"params": {"temp": 0.5}})
 
-    @patch('text_translator.cli.model_loader')
-    @patch('text_translator.cli.check_server_status')
-    @patch('text_translator.cli.process_directory')
-    def test_cli_directory_processing(self, mock_process_directory, mock_check_server_status, mock_model_loader):
+    @patch('text_translator.cli.process_directory', autospec=True)
+    def test_cli_directory_processing(self, mock_process_directory):
         """Tests that the CLI correctly processes a directory input.
 
         This test checks the CLI's behavior when the input path is a directory.
@@ -67,168 +92,273 @@ class TestCommandLineInterface(unittest.TestCase):
 
         Args:
             mock_process_directory: Mock for the `process_directory` function.
-            mock_check_server_status: Mock for the `check_server_status` function.
-            mock_model_loader: Mock for the `model_loader` module.
         """
-        mock_model_loader.load_model_configs.return_value = {"test-model": {}}
-        mock_model_loader.get_model_config.return_value = {}
+        test_args = [self.test_dir, "--model", "test-model", "--quiet"]
+        cli.main(test_args)
 
-        test_args = ["cli.py", self.test_dir, "--model", "test-model", "--quiet"]
-        with patch.object(sys, 'argv', test_args):
-            cli.main()
-
-        mock_check_server_status.assert_called_once()
+        cli.check_server_status.assert_called_once()
         mock_process_directory.assert_called_once_with(ANY, ANY)
 
         # Check that the second argument is a TranslationOptions object
         passed_options = mock_process_directory.call_args[0][1]
         self.assertIsInstance(passed_options, TranslationOptions)
 
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cli_version_flag(self, mock_stdout):
+    def test_parser_built_once(self):
+        """Tests that `cli.main()` reuses a single argument parser."""
+        test_args = [*self._BASE_ARGS, "--refine"]
+        with patch.object(self._parser, 'error', side_effect=SystemExit(2)) as mock_error, \
+                self.assertRaises(SystemExit):
+            cli.main(test_args)
+        mock_error.assert_called_once()
+        self.assertIs(cli._build_parser(), self._parser)
+
+    def test_cli_version_flag(self):
         """Tests that the --version flag prints the version and exits.
 
         This test verifies that when the `--version` argument is passed, the
         script prints the correct version string to stdout and exits with a
         status code of 0.
-
-        Args:
-            mock_stdout: A mock for `sys.stdout` to capture the output.
         """
-        test_args = ["cli.py", "--version"]
-        with patch.object(sys, 'argv', test_args):
-            with self.assertRaises(SystemExit):
-                cli.main()
+        stdout = StringIO()
+        test_args = ["--version"]
+        with redirect_stdout(stdout), self.assertRaises(SystemExit):
+            cli.main(test_args)
 
-        self.assertIn(cli.__version__, mock_stdout.getvalue())
+        self.assertIn(cli.__version__, stdout.getvalue())
 
-    @patch('text_translator.cli.model_loader')
-    @patch('text_translator.cli.check_server_status')
-    @patch('sys.stderr', new_callable=StringIO)
-    def test_cli_argument_validation_errors(self, mock_stderr, mock_check_server_status, mock_model_loader):
+    def test_cli_argument_validation_errors(self):
         """Tests that the CLI exits gracefully on argument validation errors.
 
         This test covers multiple scenarios where the provided command-line
         arguments are invalid, such as using `--refine` without `--draft-model`
         or providing a non-existent input path. It ensures the script exits
         and prints an appropriate error message.
-
-        Args:
-            mock_stderr: A mock for `sys.stderr` to capture error output.
-            mock_check_server_status: Mock for the `check_server_status` function.
-            mock_model_loader: Mock for the `model_loader` module.
         """
-        mock_model_loader.load_model_configs.return_value = {"r": {}, "m": {}}
-        mock_model_loader.get_model_config.return_value = {}
+        stderr = StringIO()
 
         # Refine without draft model
-        test_args = ["cli.py", self.input_file, "--model", "r", "--refine"]
-        with patch.object(sys, 'argv', test_args), self.assertRaises(SystemExit):
-            cli.main()
-        self.assertIn("--draft-model is required", mock_stderr.getvalue())
+        test_args = [*self._BASE_ARGS, "--refine"]
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            cli.main(test_args)
+
+        # Refinement with concurrent jobs
+        test_args = [*self._BASE_ARGS, "--refine", "--draft-model", "d", "--jobs", "2"]
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            cli.main(test_args)
 
         # Non-existent input path
-        test_args = ["cli.py", "nonexistent.txt", "--model", "m"]
-        with patch.object(sys, 'argv', test_args), self.assertRaises(SystemExit):
-            cli.main()
-        self.assertIn("Input path does not exist", mock_stderr.getvalue())
-
-    @patch('text_translator.cli.model_loader')
-    @patch('text_translator.cli.check_server_status')
-    @patch('sys.stderr', new_callable=StringIO)
-    def test_cli_glossary_validation_error(self, mock_stderr, mock_check_server_status, mock_model_loader):
+        test_args = ["nonexistent.txt", "--model", "m"]
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            cli.main(test_args)
+
+        errors = stderr.getvalue()
+        self.assertIn("--draft-model is required", errors)
+        self.assertIn("cannot be combined with --refine", errors)
+        self.assertIn("Input path does not exist", errors)
+
+    def test_cli_glossary_validation_error(self):
         """Tests that the CLI validates the use of --glossary-for.
 
         This test ensures that the script exits with an error if the
         `--glossary-for` argument is used without providing a glossary via
         `--glossary-file` or `--glossary-text`.
+        """
+        stderr = StringIO()
+        test_args = [*self._BASE_ARGS, "--glossary-for", "all"]
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            cli.main(test_args)
+        self.assertIn("--glossary-for requires a glossary", stderr.getvalue())
+
+    def test_cli_missing_glossary_file_rejected_before_server_check(self):
+        """Tests that a missing glossary file is reported as a usage error.
+
+        This test ensures that the glossary file is read before the server
+        is contacted, so a missing file exits the script before any server
+        check is attempted.
+        """
+        stderr = StringIO()
+        missing = os.path.join(self.test_dir, "missing_glossary.txt")
+        test_args = [*self._BASE_ARGS, "--glossary-file", missing]
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            cli.main(test_args)
+        self.assertIn("Glossary file not found", stderr.getvalue())
+        cli.check_server_status.assert_not_called()
+
+    @patch('text_translator.translator_lib.api_client.check_server_status')
+    def test_check_server_status_checks_every_call(self, mock_api_check):
+        """Tests that every run contacts the server instead of reusing a past result.
 
         Args:
-            mock_stderr: A mock for `sys.stderr` to capture error output.
-            mock_check_server_status: Mock for the `check_server_status` function.
-            mock_model_loader: Mock for the `model_loader` module.
+            mock_api_check: Mock for the API client's `check_server_status`.
         """
-        mock_model_loader.load_model_configs.return_value = {"m": {}}
-        mock_model_loader.get_model_config.return_value = {}
-
-        test_args = ["cli.py", self.input_file, "--model", "m", "--glossary-for", "all"]
-        with patch.object(sys, 'argv', test_args), self.assertRaises(SystemExit):
-            cli.main()
-        self.assertIn("--glossary-for requires a glossary", mock_stderr.getvalue())
-
-    @patch('text_translator.cli.translate_file', side_effect=Exception("Core error"))
-    @patch('sys.stderr', new_callable=StringIO)
-    def test_process_single_file_error_handling(self, mock_stderr, mock_translate_file):
+        self._check_server_status('http://a.url')
+        self._check_server_status('http://a.url', True)
+        self.assertEqual(mock_api_check.call_args_list, [call('http://a.url', False), call('http://a.url', True)])
+
+    def test_read_glossary_normalizes_line_endings(self):
+        """Tests that glossary files are decoded with text-mode newline handling."""
+        glossary_file = os.path.join(self.test_dir, "glossary.txt")
+        with open(glossary_file, "wb") as f:
+            f.write("用語1\r\nterm2\rterm3\n".encode("utf-8"))
+
+        self.assertEqual(cli._read_glossary(glossary_file), "用語1\nterm2\nterm3\n")
+
+    def test_read_glossary_cached_until_file_changes(self):
+        """Tests that a glossary is decoded once and re-read after it changes."""
+        glossary_file = os.path.join(self.test_dir, "glossary.txt")
+        with open(glossary_file, "wb") as f:
+            f.write("用語1\n".encode("utf-8"))
+
+        with patch('text_translator.cli.open', create=True, wraps=open) as mock_open:
+            self.assertEqual(cli._read_glossary(glossary_file), "用語1\n")
+            self.assertEqual(cli._read_glossary(glossary_file), "用語1\n")
+            self.assertEqual(mock_open.call_count, 1)
+
+            with open(glossary_file, "ab") as f:
+                f.write("term2\n".encode("utf-8"))
+            self.assertEqual(cli._read_glossary(glossary_file), "用語1\nterm2\n")
+            self.assertEqual(mock_open.call_count, 2)
+
+    @patch('text_translator.cli.translate_file', autospec=True, side_effect=_CORE_ERROR)
+    @patch('text_translator.cli.cc.print_error')
+    def test_process_single_file_error_handling(self, mock_print_error, mock_translate_file):
         """Tests that `process_single_file` handles exceptions gracefully.
 
         This test ensures that if the core `translate_file` function raises an
-        exception, the `process_single_file` wrapper catches it and prints a
-        user-friendly error message to stderr instead of crashing.
+        exception, the `process_single_file` wrapper catches it and reports a
+        user-friendly error message instead of crashing.
 
         Args:
-            mock_stderr: A mock for `sys.stderr` to capture error output.
+            mock_print_error: Mock for `color_console.print_error`.
             mock_translate_file: A mock for `translate_file` that raises an
                                  exception.
         """
-        options = TranslationOptions(input_path=self.input_file, model_name="test")
+        options = TranslationOptions(input_path=self.input_file, model_name="test", quiet=True)
         cli.process_single_file(self.input_file, None, options)
-        self.assertIn("Error processing file", mock_stderr.getvalue())
+        mock_print_error.assert_called_once_with(f"Error processing file {self.input_file}: Core error")
 
-    @patch('text_translator.cli.model_loader')
-    @patch('text_translator.cli.check_server_status')
-    @patch('text_translator.cli.process_single_file')
-    def test_cli_debug_flag(self, mock_process_single_file, mock_check_server_status, mock_model_loader):
-        """Tests that the --debug flag is correctly passed to options.
+    @patch('text_translator.cli.translate_file', autospec=True, return_value="translated")
+    def test_process_single_file_does_not_mutate_options(self, mock_translate_file):
+        """Tests that per-file paths are not written back to the shared options.
 
-        This test verifies that when the `--debug` command-line flag is used,
-        the resulting `TranslationOptions` object has its `debug` attribute
-        set to True.
+        `process_directory` hands the same `TranslationOptions` to every file,
+        so `process_single_file` must pass the per-file paths on a copy.
 
         Args:
-            mock_process_single_file: Mock for the `process_single_file` function.
-            mock_check_server_status: Mock for the `check_server_status` function.
-            mock_model_loader: Mock for the `model_loader` module.
+            mock_translate_file: A mock for `translate_file`.
         """
-        mock_model_loader.load_model_configs.return_value = {"test-model": {}}
-        mock_model_loader.get_model_config.return_value = {}
+        options = TranslationOptions(input_path=self.test_dir, model_name="test", quiet=True)
+        output_file = os.path.join(self.test_dir, "out.txt")
+        cli.process_single_file(self.input_file, output_file, options)
 
-        test_args = ["cli.py", self.input_file, "--model", "test-model", "--debug"]
-        with patch.object(sys, 'argv', test_args):
-            cli.main()
+        self.assertEqual(options.input_path, self.test_dir)
+        self.assertIsNone(options.output_path)
+        passed_options = mock_translate_file.call_args[0][0]
+        self.assertEqual(passed_options.input_path, self.input_file)
+        self.assertEqual(passed_options.output_path, output_file)
 
-        passed_options = mock_process_single_file.call_args[0][2]
-        self.assertTrue(passed_options.debug)
+    @patch('text_translator.cli.translate_file', autospec=True, return_value="translated")
+    def test_process_single_file_writes_output_atomically(self, mock_translate_file):
+        """Tests that the output is written in full and no temporary file is left.
+
+        Args:
+            mock_translate_file: A mock for `translate_file`.
+        """
+        options = TranslationOptions(input_path=self.test_dir, model_name="test", quiet=True)
+        output_file = os.path.join(self.test_dir, "out.txt")
+        cli.process_single_file(self.input_file, output_file, options)
+
+        with open(output_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), "translated")
+        self.assertEqual(os.listdir(self.test_dir), ["out.txt"])
+
+    def test_write_atomic_encodes_large_content_in_chunks(self):
+        """Tests that chunked writes produce the same bytes as a single encode."""
+        content = "訳文 line\n" * 50
+        output_file = os.path.join(self.test_dir, "out.txt")
+        with patch.multiple(cli, CHUNKED_WRITE_THRESHOLD=16, WRITE_CHUNK_SIZE=7):
+            cli._write_atomic(output_file, content)
+
+        with open(output_file, 'rb') as f:
+            self.assertEqual(f.read(), content.encode('utf-8'))
+
+    def test_write_atomic_translates_newlines_like_text_mode(self):
+        """Tests that both write paths emit `os.linesep`, as text mode would."""
+        content = "line one\nline two\n" * 4
+        output_file = os.path.join(self.test_dir, "out.txt")
+        for threshold in (len(content), 16):
+            with self.subTest(chunked=threshold < len(content)), \
+                 patch('text_translator.cli.os.linesep', '\r\n'), \
+                 patch.multiple(cli, CHUNKED_WRITE_THRESHOLD=threshold, WRITE_CHUNK_SIZE=7):
+                cli._write_atomic(output_file, content)
+                with open(output_file, 'rb') as f:
+                    self.assertEqual(f.read(), content.replace("\n", "\r\n").encode('utf-8'))
+
+    @patch('text_translator.cli.translate_file', autospec=True, return_value="")
+    def test_process_single_file_skips_existing_output(self, mock_translate_file):
+        """Tests that an existing output is left untouched without --overwrite.
+
+        Args:
+            mock_translate_file: A mock for `translate_file`.
+        """
+        options = TranslationOptions(input_path=self.test_dir, model_name="test", quiet=True)
+        output_file = os.path.join(self.test_dir, "done.txt")
+        with open(output_file, "w", encoding='utf-8') as f:
+            f.write("already translated")
+
+        cli.process_single_file(self.input_file, output_file, options)
 
-    @patch('text_translator.cli.model_loader')
-    @patch('text_translator.cli.check_server_status')
-    @patch('text_translator.cli.process_single_file')
-    def test_cli_reasoning_for_argument(self, mock_process_single_file, mock_check_server_status, mock_model_loader):
-        """Tests that the --reasoning-for argument is correctly passed.
+        mock_translate_file.assert_not_called()
+        with open(output_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), "already translated")
 
-        This test ensures that when the `--reasoning-for` command-line argument
-        is provided, its value is correctly stored in the `reasoning_for`
-        attribute of the `TranslationOptions` object.
+    @patch('text_translator.cli.translate_file', autospec=True, return_value="translated")
+    def test_process_single_file_recreates_removed_output_dir(self, mock_translate_file):
+        """Tests that an output directory removed between runs is created again.
 
         Args:
-            mock_process_single_file: Mock for the `process_single_file` function.
-            mock_check_server_status: Mock for the `check_server_status` function.
-            mock_model_loader: Mock for the `model_loader` module.
+            mock_translate_file: A mock for `translate_file`.
         """
-        mock_model_loader.load_model_configs.return_value = {"test-model": {}}
-        mock_model_loader.get_model_config.return_value = {}
+        options = TranslationOptions(input_path=self.test_dir, model_name="test", quiet=True)
+        output_dir = os.path.join(self.test_dir, "out")
 
-        test_args = ["cli.py", self.input_file, "--model", "test-model", "--reasoning-for", "main"]
-        with patch.object(sys, 'argv', test_args):
-            cli.main()
+        cli.process_single_file(self.input_file, os.path.join(output_dir, "a.txt"), options)
+        shutil.rmtree(output_dir)
+        cli.process_single_file(self.input_file, os.path.join(output_dir, "b.txt"), options)
 
-        self.assertTrue(mock_process_single_file.called)
-        passed_options = mock_process_single_file.call_args[0][2]
-        self.assertEqual(passed_options.reasoning_for, "main")
+        self.assertTrue(os.path.isfile(os.path.join(output_dir, "b.txt")))
+
+    def _options_for(self, extra_args):
+        """Builds the `TranslationOptions` for the input file and `extra_args`.
+
+        Only argument parsing and option assembly run, so no server check or
+        file processing needs to be mocked.
+
+        Args:
+            extra_args: Command-line arguments appended after the input file
+                        and `--model test-model`.
+        """
+        args = cli._parse_args([*self._BASE_ARGS, *extra_args])
+        return cli._build_translation_options(args, None, {}, {})
+
+    def test_cli_flags_passed_to_options(self):
+        """Tests that command-line flags are correctly passed to options.
 
-    @patch('text_translator.cli.model_loader')
-    @patch('text_translator.cli.check_server_status')
-    @patch('text_translator.cli.process_directory')
-    def test_main_api_url_from_env(self, mock_process, mock_check_server_status, mock_model_loader):
+        Each case parses one extra flag and verifies the matching
+        attribute of the resulting `TranslationOptions` object.
+        """
+        cases = [
+            (["--debug"], "debug", True),
+            (["--reasoning-for", "main"], "reasoning_for", "main"),
+            (["--line-by-line"], "line_by_line", True),
+        ]
+        for extra_args, attribute, expected in cases:
+            with self.subTest(args=extra_args):
+                passed_options = self._options_for(extra_args)
+                self.assertEqual(getattr(passed_options, attribute), expected)
+
+    @patch('text_translator.cli.process_directory', autospec=True)
+    def test_main_api_url_from_env(self, mock_process):
         """Tests that the API URL is correctly sourced from an environment variable.
 
         This test verifies that if the `OOBABOOGA_API_BASE_URL` environment
@@ -237,35 +367,34 @@ class TestCommandLineInterface(unittest.TestCase):
 
         Args:
             mock_process: Mock for the `process_directory` function.
-            mock_check_server_status: Mock for the `check_server_status` function.
-            mock_model_loader: Mock for the `model_loader` module.
         """
-        mock_model_loader.load_model_configs.return_value = {"m": {}}
-        mock_model_loader.get_model_config.return_value = {}
-
-        test_args = ["cli.py", self.test_dir, "--model", "m"]
+        test_args = [self.test_dir, "--model", "m"]
         with patch.dict(os.environ, {'OOBABOOGA_API_BASE_URL': 'http://env.url'}):
-            with patch.object(sys, 'argv', test_args):
-                cli.main()
+            cli.main(test_args)
 
-        mock_check_server_status.assert_called_once_with('http://env.url', False)
+        cli.check_server_status.assert_called_once_with('http://env.url', False)
         passed_options = mock_process.call_args[0][1]
         self.assertEqual(passed_options.api_base_url, 'http://env.url')
 
 class TestDirectoryProcessing(unittest.TestCase):
     """Tests for directory processing functionality in the CLI."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Builds the options template that each test specializes."""
+        cls._options_template = TranslationOptions(input_path="", model_name="test")
+
     def setUp(self):
         """Sets up a temporary directory for directory-related tests."""
         self.test_dir = tempfile.mkdtemp()
         self.output_dir = os.path.join(self.test_dir, "output")
-        self.base_options = TranslationOptions(input_path=self.test_dir, model_name="test")
+        self.base_options = dataclasses.replace(self._options_template, input_path=self.test_dir)
 
     def tearDown(self):
         """Removes the temporary directory after tests are run."""
         shutil.rmtree(self.test_dir)
 
-    @patch('text_translator.cli.process_single_file')
+    @patch('text_translator.cli.process_single_file', autospec=True)
     def test_process_directory_recursive(self, mock_process_single_file):
         """Tests that directory processing works recursively.
 
@@ -280,16 +409,18 @@ class TestDirectoryProcessing(unittest.TestCase):
         os.makedirs(dir1)
         file1 = os.path.join(self.test_dir, "file1.txt")
         file2 = os.path.join(dir1, "file2.txt")
-        open(file1, 'w').close()
-        open(file2, 'w').close()
+        Path(file1).touch()
+        Path(file2).touch()
 
-        args = unittest.mock.Mock(input_path=self.test_dir, output=self.output_dir, recursive=True)
+        args = argparse.Namespace(input_path=self.test_dir, output=self.output_dir, recursive=True, jobs=1)
 
         cli.process_directory(args, self.base_options)
 
         self.assertEqual(mock_process_single_file.call_count, 2)
+        mock_process_single_file.assert_any_call(file1, os.path.join(self.output_dir, "file1.txt"), self.base_options)
+        mock_process_single_file.assert_any_call(file2, os.path.join(self.output_dir, "dir1", "file2.txt"), self.base_options)
 
-    @patch('text_translator.cli.process_single_file')
+    @patch('text_translator.cli.process_single_file', autospec=True)
     def test_process_directory_non_recursive(self, mock_process_single_file):
         """Tests that directory processing can be limited to non-recursive.
 
@@ -304,15 +435,130 @@ class TestDirectoryProcessing(unittest.TestCase):
         os.makedirs(dir1)
         file1 = os.path.join(self.test_dir, "file1.txt")
         file2 = os.path.join(dir1, "file2.txt")
-        open(file1, 'w').close()
-        open(file2, 'w').close()
+        Path(file1).touch()
+        Path(file2).touch()
 
-        args = unittest.mock.Mock(input_path=self.test_dir, output=self.output_dir, recursive=False)
+        args = argparse.Namespace(input_path=self.test_dir, output=self.output_dir, recursive=False, jobs=1)
 
         cli.process_directory(args, self.base_options)
 
         self.assertEqual(mock_process_single_file.call_count, 1)
         mock_process_single_file.assert_called_once_with(file1, os.path.join(self.output_dir, "file1.txt"), self.base_options)
 
+    @patch('text_translator.cli.process_single_file', autospec=True)
+    def test_process_directory_concurrent_jobs(self, mock_process_single_file):
+        """Tests that directory processing can dispatch files to a thread pool.
+
+        This test verifies that with `jobs` greater than one, every file is
+        still processed exactly once with the shared options object.
+
+        Args:
+            mock_process_single_file: Mock for the `process_single_file` function.
+        """
+        for name in ("a.txt", "b.txt", "c.txt"):
+            Path(os.path.join(self.test_dir, name)).touch()
+
+        args = argparse.Namespace(input_path=self.test_dir, output=self.output_dir, recursive=False, jobs=4)
+
+        cli.process_directory(args, self.base_options)
+
+        self.assertEqual(mock_process_single_file.call_count, 3)
+        processed = sorted(c[0][0] for c in mock_process_single_file.call_args_list)
+        self.assertEqual(processed, [os.path.join(self.test_dir, n) for n in ("a.txt", "b.txt", "c.txt")])
+        for c in mock_process_single_file.call_args_list:
+            self.assertIs(c[0][2], self.base_options)
+
+    @patch('text_translator.cli.cc.print_error')
+    @patch('text_translator.cli.process_single_file', autospec=True)
+    def test_process_directory_skips_files_blocked_by_output_file(self, mock_process_single_file, mock_print_error):
+        """Tests that files whose output directory is blocked by a file are skipped.
+
+        Args:
+            mock_process_single_file: Mock for the `process_single_file` function.
+            mock_print_error: Mock for `color_console.print_error`.
+        """
+        input_dir = os.path.join(self.test_dir, "input")
+        dir1 = os.path.join(input_dir, "dir1")
+        os.makedirs(dir1)
+        for name in ("a.txt", "b.txt"):
+            Path(os.path.join(dir1, name)).touch()
+        os.makedirs(self.output_dir)
+        Path(os.path.join(self.output_dir, "dir1")).touch()
+
+        args = argparse.Namespace(input_path=input_dir, output=self.output_dir, recursive=True, jobs=1)
+
+        cli.process_directory(args, self.base_options)
+
+        mock_process_single_file.assert_not_called()
+        mock_print_error.assert_called_once()
+        self.assertTrue(mock_print_error.call_args[0][0].startswith(f"Skipping files in '{dir1}'"))
+
+    @patch('text_translator.cli.process_single_file', autospec=True)
+    def test_process_directory_creates_no_directories_before_writing(self, mock_process_single_file):
+        """Tests that collecting the files creates only the output base directory.
+
+        Output subdirectories are created when a file is written into them,
+        so a run that is interrupted (or never writes) leaves no empty tree.
+
+        Args:
+            mock_process_single_file: Mock for the `process_single_file` function.
+        """
+        input_dir = os.path.join(self.test_dir, "input")
+        os.makedirs(os.path.join(input_dir, "dir1"))
+        Path(os.path.join(input_dir, "dir1", "a.txt")).touch()
+
+        args = argparse.Namespace(input_path=input_dir, output=self.output_dir, recursive=True, jobs=1)
+
+        cli.process_directory(args, self.base_options)
+
+        mock_process_single_file.assert_called_once()
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+    @patch('text_translator.cli.process_single_file', autospec=True)
+    def test_process_directory_creates_output_base_for_empty_input(self, mock_process_single_file):
+        """Tests that the output base directory exists even when no file is processed.
+
+        Args:
+            mock_process_single_file: Mock for the `process_single_file` function.
+        """
+        input_dir = os.path.join(self.test_dir, "input")
+        os.makedirs(input_dir)
+
+        args = argparse.Namespace(input_path=input_dir, output=self.output_dir, recursive=True, jobs=1)
+
+        cli.process_directory(args, self.base_options)
+
+        mock_process_single_file.assert_not_called()
+        self.assertTrue(os.path.isdir(self.output_dir))
+
+    @patch('text_translator.cli.process_single_file', autospec=True)
+    def test_process_directory_leaves_stat_errors_to_each_file(self, mock_process_single_file):
+        """Tests that a permission error on one output directory does not abort the run.
+
+        Args:
+            mock_process_single_file: Mock for the `process_single_file` function.
+        """
+        input_dir = os.path.join(self.test_dir, "input")
+        os.makedirs(os.path.join(input_dir, "dir1"))
+        Path(os.path.join(input_dir, "dir1", "a.txt")).touch()
+        Path(os.path.join(input_dir, "b.txt")).touch()
+        blocked_stat_dir = os.path.join(self.output_dir, "dir1")
+        real_stat = os.stat
+
+        def stat(path, *args, **kwargs):
+            if path == blocked_stat_dir:
+                raise PermissionError(13, "Permission denied", path)
+            return real_stat(path, *args, **kwargs)
+
+        args = argparse.Namespace(input_path=input_dir, output=self.output_dir, recursive=True, jobs=1)
+
+        with patch('text_translator.cli.os.stat', side_effect=stat):
+            cli.process_directory(args, self.base_options)
+
+        self.assertEqual(mock_process_single_file.call_count, 2)
+
 if __name__ == '__main__':
-    unittest.main()
+    # Run the tests in definition order; the default loader sorts them by name.
+    loader = unittest.TestLoader()
+    loader.sortTestMethodsUsing = None
+    unittest.main(testLoader=loader)
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import sys
 
 # Temporarily add the parent directory to the path to allow direct execution of the test
@@ -17,81 +17,78 @@ else:
 
 class TestColorConsole(unittest.TestCase):
 
-    @patch('text_translator.color_console.IS_TTY', True)
-    @patch('builtins.print')
-    def test_print_success_color(self, mock_print):
-        """Test that print_success uses the correct color code."""
-        print_success("Success message")
-        mock_print.assert_called_once()
-        self.assertEqual(mock_print.call_args[0][0], f"{COLOR_SUCCESS}Success message{COLOR_RESET}")
+    @classmethod
+    def setUpClass(cls):
+        """Patch `print` once for the whole class; each test starts from a reset mock."""
+        cls._console = sys.modules[print_info.__module__]
+        print_patcher = patch('builtins.print')
+        cls.mock_print = print_patcher.start()
+        cls.addClassCleanup(print_patcher.stop)
 
-    @patch('text_translator.color_console.IS_TTY', True)
-    @patch('builtins.print')
-    def test_print_warning_color(self, mock_print):
-        """Test that print_warning uses the correct color code."""
-        print_warning("Warning message")
-        mock_print.assert_called_once()
-        self.assertEqual(mock_print.call_args[0][0], f"{COLOR_WARNING}Warning message{COLOR_RESET}")
+    def setUp(self):
+        """Clear calls from the previous test and remember the TTY flag."""
+        self.mock_print.reset_mock()
+        self._saved_tty = self._console.IS_TTY
 
-    @patch('text_translator.color_console.IS_TTY', True)
-    @patch('builtins.print')
-    def test_print_error_color(self, mock_print):
-        """Test that print_error uses the correct color code and stderr."""
-        print_error("Error message")
-        mock_print.assert_called_once()
-        self.assertEqual(mock_print.call_args[0][0], f"{COLOR_ERROR}Error message{COLOR_RESET}")
-        self.assertEqual(mock_print.call_args[1]['file'], sys.stderr)
+    def tearDown(self):
+        """Restore the TTY flag a test may have overridden."""
+        self._console.IS_TTY = self._saved_tty
 
-    @patch('text_translator.color_console.IS_TTY', True)
-    @patch('builtins.print')
-    def test_print_info_color(self, mock_print):
-        """Test that print_info uses the correct color code."""
-        print_info("Info message")
-        mock_print.assert_called_once()
-        self.assertEqual(mock_print.call_args[0][0], f"{COLOR_INFO}Info message{COLOR_RESET}")
+    def test_print_colors(self):
+        """Test that each status printer uses its color code, and print_error uses stderr."""
+        self._console.IS_TTY = True
+        cases = [
+            (print_success, COLOR_SUCCESS, {}),
+            (print_warning, COLOR_WARNING, {}),
+            (print_error, COLOR_ERROR, {'file': sys.stderr}),
+            (print_info, COLOR_INFO, {}),
+        ]
+        for printer, color, expected_kwargs in cases:
+            with self.subTest(printer=printer.__name__):
+                self.mock_print.reset_mock()
+                printer("Status message")
+                self.mock_print.assert_called_once()
+                self.assertEqual(self.mock_print.call_args[0][0], f"{color}Status message{COLOR_RESET}")
+                for key, value in expected_kwargs.items():
+                    self.assertEqual(self.mock_print.call_args[1][key], value)
 
-    @patch('text_translator.color_console.IS_TTY', False)
-    @patch('builtins.print')
-    def test_no_color_when_not_tty(self, mock_print):
+    def test_no_color_when_not_tty(self):
         """Test that no color codes are used when not in a TTY."""
+        self._console.IS_TTY = False
         print_success("Plain message")
-        mock_print.assert_called_once()
-        self.assertEqual(mock_print.call_args[0][0], "Plain message")
+        self.mock_print.assert_called_once()
+        self.assertEqual(self.mock_print.call_args[0][0], "Plain message")
 
-    @patch('builtins.print')
-    def test_quiet_mode_suppresses_output(self, mock_print):
+    def test_quiet_mode_suppresses_output(self):
         """Test that no output is generated when quiet is True."""
         print_success("Should not be printed", quiet=True)
         print_warning("Should not be printed", quiet=True)
         print_error("Should not be printed", quiet=True)
         print_info("Should not be printed", quiet=True)
-        mock_print.assert_not_called()
+        self.mock_print.assert_not_called()
 
-    @patch('text_translator.color_console.IS_TTY', True)
-    @patch('builtins.print')
-    def test_print_translation_with_color(self, mock_print):
+    def test_print_translation_with_color(self):
         """Test print_translation with color."""
+        self._console.IS_TTY = True
         print_translation("Translated text")
-        self.assertEqual(mock_print.call_count, 3)
-        mock_print.assert_any_call(f"\n{COLOR_INFO}--- Translated Content ---{COLOR_RESET}")
-        mock_print.assert_any_call("Translated text")
-        mock_print.assert_any_call(f"{COLOR_INFO}--------------------------{COLOR_RESET}")
+        self.assertEqual(self.mock_print.call_count, 3)
+        self.mock_print.assert_any_call(f"\n{COLOR_INFO}--- Translated Content ---{COLOR_RESET}")
+        self.mock_print.assert_any_call("Translated text")
+        self.mock_print.assert_any_call(f"{COLOR_INFO}--------------------------{COLOR_RESET}")
 
-    @patch('text_translator.color_console.IS_TTY', False)
-    @patch('builtins.print')
-    def test_print_translation_no_color(self, mock_print):
+    def test_print_translation_no_color(self):
         """Test print_translation without color."""
+        self._console.IS_TTY = False
         print_translation("Translated text")
-        self.assertEqual(mock_print.call_count, 3)
-        mock_print.assert_any_call("\n--- Translated Content ---")
-        mock_print.assert_any_call("Translated text")
-        mock_print.assert_any_call("--------------------------")
+        self.assertEqual(self.mock_print.call_count, 3)
+        self.mock_print.assert_any_call("\n--- Translated Content ---")
+        self.mock_print.assert_any_call("Translated text")
+        self.mock_print.assert_any_call("--------------------------")
 
-    @patch('builtins.print')
-    def test_print_translation_quiet(self, mock_print):
+    def test_print_translation_quiet(self):
         """Test print_translation in quiet mode."""
         print_translation("Translated text", quiet=True)
-        mock_print.assert_called_once_with("Translated text")
+        self.mock_print.assert_called_once_with("Translated text")
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,8 @@
+import dataclasses
 import unittest
 from unittest.mock import patch, MagicMock, call
 import os
+import threading
 import requests
 from io import StringIO
 
@@ -9,34 +11,56 @@ from text_translator.translator_lib.options import TranslationOptions
 from text_translator.translator_lib.exceptions import APIConnectionError, ModelLoadError, TranslatorError
 from langdetect import LangDetectException
 
+# Retry backoff and model-switch waits call time.sleep; no test here needs real delays.
+_sleep_patcher = patch('time.sleep')
+
+
+def setUpModule():
+    _sleep_patcher.start()
+
+
+def tearDownModule():
+    _sleep_patcher.stop()
+
 class TestCoreWorkflow(unittest.TestCase):
     """Tests the high-level translation workflows in the `core` module."""
 
-    def setUp(self):
-        """Sets up common mock configurations and options for workflow tests."""
-        self.mock_model_config = {
+    @classmethod
+    def setUpClass(cls):
+        """Builds the shared configs and patches out file IO for every workflow test."""
+        cls.mock_model_config = {
             "prompt_template": "Test prompt: {text}",
             "params": {"temperature": 0.5}
         }
-        self.mock_draft_config = {
+        cls.mock_draft_config = {
             "prompt_template": "Draft prompt: {text}",
             "params": {"temperature": 0.9}
         }
-        self.base_options = TranslationOptions(
+        cls._options_template = TranslationOptions(
             input_path="input.txt",
             model_name="test-model",
             api_base_url="http://test.url",
             quiet=True,
-            model_config=self.mock_model_config,
-            draft_model_config=self.mock_draft_config
+            model_config=cls.mock_model_config,
+            draft_model_config=cls.mock_draft_config
         )
+        # No workflow test touches the real filesystem; tests that need a
+        # different result patch these again locally.
+        for patcher in (
+            patch('os.path.exists', return_value=False),
+            patch('builtins.open'),
+            patch('custom_xml_parser.parser.deserialize'),
+        ):
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        """Gives each test its own copy of the options, which tests mutate."""
+        self.base_options = dataclasses.replace(self._options_template)
 
     def test_direct_translation_workflow(self):
         """Test the end-to-end direct translation workflow."""
-        with patch('os.path.exists', return_value=False), \
-             patch('builtins.open'), \
-             patch('custom_xml_parser.parser.deserialize'), \
-             patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
+        with patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
              patch('text_translator.translator_lib.core.ensure_model_loaded') as mock_ensure_model, \
              patch('text_translator.translator_lib.core.get_translation') as mock_get_translation:
 
@@ -58,10 +82,7 @@ class TestCoreWorkflow(unittest.TestCase):
 
     def test_refinement_workflow(self):
         """Test the end-to-end refinement translation workflow."""
-        with patch('os.path.exists', return_value=False), \
-             patch('builtins.open'), \
-             patch('custom_xml_parser.parser.deserialize'), \
-             patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
+        with patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
              patch('text_translator.translator_lib.core._get_refined_translation') as mock_get_refined:
 
             mock_collect.side_effect = lambda data, lst: lst.extend([{'#text': 'one'}])
@@ -80,10 +101,7 @@ class TestCoreWorkflow(unittest.TestCase):
 
     def test_no_nodes_to_translate(self):
         """Test that the function exits early if no text nodes are found."""
-        with patch('os.path.exists', return_value=False), \
-             patch('builtins.open'), \
-             patch('custom_xml_parser.parser.deserialize'), \
-             patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
+        with patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
              patch('text_translator.translator_lib.core.ensure_model_loaded') as mock_ensure_model:
 
             mock_collect.side_effect = lambda data, lst: None
@@ -94,9 +112,7 @@ class TestCoreWorkflow(unittest.TestCase):
 
     def test_line_by_line_preserves_trailing_newline(self):
         """Test that line-by-line translation preserves a trailing newline."""
-        with patch('os.path.exists', return_value=False), \
-             patch('builtins.open'), \
-             patch('custom_xml_parser.parser.deserialize') as mock_deserialize, \
+        with patch('custom_xml_parser.parser.deserialize') as mock_deserialize, \
              patch('text_translator.translator_lib.data_processor.detect', return_value='ja'), \
              patch('text_translator.translator_lib.core.ensure_model_loaded'), \
              patch('text_translator.translator_lib.core.get_translation') as mock_get_translation, \
@@ -117,15 +133,11 @@ class TestCoreWorkflow(unittest.TestCase):
 
     def test_refinement_fails_with_multiline_in_line_by_line_mode(self):
         """Test that a refined translation failure is handled gracefully and a warning is logged."""
-        with patch('os.path.exists', return_value=False), \
-             patch('builtins.open'), \
-             patch('custom_xml_parser.parser.deserialize'), \
-             patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
+        with patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
              patch('text_translator.translator_lib.translation.ensure_model_loaded'), \
              patch('text_translator.translator_lib.translation.get_translation') as mock_get_translation, \
              patch('text_translator.translator_lib.translation._api_request') as mock_api_request, \
-             patch('sys.stderr', new_callable=StringIO) as mock_stderr, \
-             patch('time.sleep'):
+             patch('sys.stderr', new_callable=StringIO) as mock_stderr:
 
             mock_collect.side_effect = lambda data, lst: lst.extend([{'#text': 'single line'}])
             mock_get_translation.return_value = "A valid draft translation."
@@ -147,10 +159,7 @@ class TestCoreWorkflow(unittest.TestCase):
 
     def test_direct_translation_with_reasoning(self):
         """Test the direct translation workflow with reasoning enabled."""
-        with patch('os.path.exists', return_value=False), \
-             patch('builtins.open'), \
-             patch('custom_xml_parser.parser.deserialize'), \
-             patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
+        with patch('text_translator.translator_lib.core.collect_text_nodes') as mock_collect, \
              patch('text_translator.translator_lib.core.ensure_model_loaded'), \
              patch('text_translator.translator_lib.core.get_translation') as mock_get_translation:
 
@@ -181,9 +190,7 @@ class TestCoreWorkflow(unittest.TestCase):
         Test that if translation returns an empty string, the original text is preserved
         and the `jp_text:::` marker is NOT added. This test should FAIL before the fix.
         """
-        with patch('os.path.exists', return_value=False), \
-             patch('builtins.open'), \
-             patch('custom_xml_parser.parser.deserialize') as mock_deserialize, \
+        with patch('custom_xml_parser.parser.deserialize') as mock_deserialize, \
              patch('text_translator.translator_lib.data_processor.detect', return_value='ja'), \
              patch('text_translator.translator_lib.core.ensure_model_loaded'), \
              patch('text_translator.translator_lib.core.get_translation') as mock_get_translation, \
@@ -208,9 +215,10 @@ class TestCoreWorkflow(unittest.TestCase):
 
 class TestGetTranslation(unittest.TestCase):
     """Tests the `get_translation` function's logic and integrations."""
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Sets up a standard model configuration for translation tests."""
-        self.model_config = {
+        cls.model_config = {
             "prompt_template": "{glossary_section}Translate: {text}",
             "reasoning_prompt_template": "{glossary_section}Reason and translate: {text}",
             "glossary_prompt_template": "# Glossary\n{glossary_text}",
@@ -340,8 +348,7 @@ class TestGetTranslation(unittest.TestCase):
     def test_get_translation_retry_on_connection_error(self):
         """Test that get_translation retries on APIConnectionError."""
         with patch('text_translator.translator_lib.translation._api_request', side_effect=[APIConnectionError, {"choices": [{"message": {"content": "translated"}}]}]), \
-             patch('text_translator.translator_lib.validation.is_translation_valid', return_value=True), \
-             patch('time.sleep'):
+             patch('text_translator.translator_lib.validation.is_translation_valid', return_value=True):
             # This should succeed because the second attempt works
             result = translation.get_translation("original", "test-model", "http://test.url", self.model_config)
             self.assertEqual(result, "translated")
@@ -349,8 +356,7 @@ class TestGetTranslation(unittest.TestCase):
     def test_get_translation_raises_translator_error_on_persistent_connection_error(self):
         """Test that get_translation raises TranslatorError after retries on ConnectionError."""
         with patch('text_translator.translator_lib.translation._api_request', side_effect=APIConnectionError("API is down")), \
-             patch('text_translator.translator_lib.validation.is_translation_valid', return_value=True), \
-             patch('time.sleep'):  # Mock sleep to avoid waiting
+             patch('text_translator.translator_lib.validation.is_translation_valid', return_value=True):
             with self.assertRaises(TranslatorError):
                 translation.get_translation("original", "test-model", "http://test.url", self.model_config)
 
@@ -457,7 +463,7 @@ class TestAdvancedTranslationExtraction(unittest.TestCase):
 class TestApiAndModelHelpers(unittest.TestCase):
     """Tests helper functions in `api_client` related to model management."""
     def test_api_request_debug_printing(self):
-        with patch('requests.post') as mock_post, \
+        with patch.object(api_client._get_session(), 'post') as mock_post, \
              patch('sys.stderr', new_callable=StringIO) as mock_stderr:
 
             mock_post.return_value.json.return_value = {"status": "ok"}
@@ -481,12 +487,21 @@ class TestApiAndModelHelpers(unittest.TestCase):
 
     def test_api_request_get(self):
         """Test that _api_request can make a GET request."""
-        with patch('requests.get') as mock_get:
+        with patch.object(api_client._get_session(), 'get') as mock_get:
             mock_get.return_value.json.return_value = {"status": "ok"}
             with patch('text_translator.translator_lib.api_client.retry_with_backoff', lambda: lambda f: f):
                 api_client._api_request("test/endpoint", {}, "http://test.url", is_get=True)
             mock_get.assert_called_once()
 
+    def test_get_session_is_per_thread(self):
+        """Test that each thread reuses its own session rather than sharing one."""
+        sessions = []
+        worker = threading.Thread(target=lambda: sessions.append(api_client._get_session()))
+        worker.start()
+        worker.join()
+        self.assertIs(api_client._get_session(), api_client._get_session())
+        self.assertIsNot(sessions[0], api_client._get_session())
+
     def test_check_server_status_connection_error(self):
         """Test that check_server_status raises APIConnectionError on failure."""
         with patch('text_translator.translator_lib.api_client._api_request', side_effect=APIConnectionError("Server down")):
@@ -498,8 +513,7 @@ class TestApiAndModelHelpers(unittest.TestCase):
         with patch('text_translator.translator_lib.api_client._api_request') as mock_api_request, \
              patch('builtins.print') as mock_print:
             mock_api_request.side_effect = [{"model_name": "other-model"}, {"result": "success"}]
-            with patch('time.sleep'): # Patch sleep to speed up test
-                 api_client.ensure_model_loaded("test-model", "http://test.url", verbose=True)
+            api_client.ensure_model_loaded("test-model", "http://test.url", verbose=True)
 
             # Check that verbose messages were printed
             self.assertIn(call("Switching model to 'test-model' with new configuration..."), mock_print.call_args_list)
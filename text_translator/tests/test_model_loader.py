@@ -39,6 +39,17 @@ class TestModelLoader(unittest.TestCase):
         self.assertEqual(resolved_configs["child"]["params"]["p1"], "v1")
         self.assertEqual(resolved_configs["child"]["params"]["p2"], "override")
 
+    def test_load_model_configs_cached_until_file_changes(self):
+        """Tests that a config file is parsed once and reloaded after edits."""
+        self._write_config({"model_a": {"params": {"temp": 0.5}}})
+        first = load_model_configs(self.config_path)
+        self.assertIs(load_model_configs(self.config_path), first)
+
+        self._write_config({"model_a": {"params": {"temp": 0.75}}, "model_b": {}})
+        reloaded = load_model_configs(self.config_path)
+        self.assertIsNot(reloaded, first)
+        self.assertIn("model_b", reloaded)
+
     def test_load_model_configs_file_not_found(self):
         """Tests that a ModelConfigError is raised for a non-existent file."""
         with self.assertRaises(ModelConfigError):
@@ -3,6 +3,7 @@ import sys
 import os
 import time
 import json
+import threading
 from typing import Any, Dict, Optional, Callable, TypeVar
 from functools import wraps
 from .exceptions import APIConnectionError, APIStatusError, ModelLoadError
@@ -12,6 +13,19 @@ from .exceptions import APIConnectionError, APIStatusError, ModelLoadError
 # arguments or environment variables.
 DEFAULT_API_BASE_URL: str = "http://127.0.0.1:5000/v1"
 
+# Each thread keeps one session so that its connection pool can keep
+# connections to the API server alive between calls (and between files),
+# instead of opening a new TCP connection for each request. `requests` does not
+# guarantee that a session is thread-safe, so `--jobs` workers do not share one.
+_thread_state = threading.local()
+
+def _get_session() -> requests.Session:
+    """Returns the calling thread's `requests.Session`, creating it on first use."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _thread_state.session = requests.Session()
+    return session
+
 T = TypeVar('T')
 
 def retry_with_backoff(retries: int = 3, backoff_in_seconds: float = 1.0, border_base: int = 2) -> Callable[[Callable[..., T]], Callable[..., T]]:
@@ -86,10 +100,11 @@ def _api_request(endpoint: str, payload: Dict[str, Any], api_base_url: str, time
         print(f"--- DEBUG: API Request Payload ---\n{json.dumps(payload, indent=2)}\n-------------------------------------", file=sys.stderr)
 
     try:
+        session = _get_session()
         if is_get:
-            response = requests.get(f"{api_base_url}/{endpoint}", timeout=timeout)
+            response = session.get(f"{api_base_url}/{endpoint}", timeout=timeout)
         else:
-            response = requests.post(f"{api_base_url}/{endpoint}", json=payload, headers=headers, timeout=timeout)
+            response = session.post(f"{api_base_url}/{endpoint}", json=payload, headers=headers, timeout=timeout)
 
         response.raise_for_status()
         response_data = response.json()
@@ -95,8 +95,10 @@ def translate_file(options: TranslationOptions) -> str:
             print(f"Output file {options.output_path} already exists. Skipping.")
         return ""
 
-    with open(options.input_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Read raw bytes and decode once; the parser splits lines itself, so the
+    # text layer's incremental decoding and newline translation buy nothing.
+    with open(options.input_path, 'rb') as f:
+        content = f.read().decode('utf-8')
     data_structure = parser.deserialize(content)
 
     nodes_to_translate: List[Dict[str, Any]] = []
@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 from typing import Dict, Any, Set
@@ -111,7 +112,10 @@ def load_model_configs(config_path: str) -> Dict[str, Any]:
     build its complete configuration, resolving any `inherits` clauses.
 
     The result is a dictionary where keys are model names and values are their
-    fully resolved configuration objects.
+    fully resolved configuration objects. Results are cached per file and
+    reused until the file's modification time, size or inode changes (the
+    inode catches a file replaced by rename), so callers must treat the
+    returned dictionary as read-only.
 
     Args:
         config_path: The file path to the JSON configuration file.
@@ -123,9 +127,16 @@ def load_model_configs(config_path: str) -> Dict[str, Any]:
         ModelConfigError: If the config file is not found, cannot be parsed,
                           or contains circular dependencies.
     """
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         raise ModelConfigError(f"Model configuration file not found at: {config_path}")
 
+    return _load_model_configs_cached(config_path, st.st_mtime_ns, st.st_size, st.st_ino)
+
+@functools.lru_cache(maxsize=4)
+def _load_model_configs_cached(config_path: str, mtime_ns: int, size: int, inode: int) -> Dict[str, Any]:
+    """Parses and resolves `config_path`; the stat fields only key the cache."""
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
             configs = json.load(f)
@@ -174,8 +185,9 @@ def get_model_config(
             f"Model '{model_name}' not found in configuration, and no default ('{default_config_key}') is defined."
         )
 
-    # Ensure the config has the expected structure
-    if "params" not in config:
-        config["params"] = {}
+    # Ensure the config has the expected structure. This is done on the copy,
+    # as `all_configs` may be the cached result of `load_model_configs`.
+    config = copy.deepcopy(config)
+    config.setdefault("params", {})
 
-    return copy.deepcopy(config)
+    return config